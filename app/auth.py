@@ -25,28 +25,105 @@ Expected users.yaml structure:
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
-import bcrypt
-import yaml
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.panel import Panel
 
+# bcrypt and yaml are imported lazily inside the functions that need them:
+# auth is OFF by default, and importing them at module load would add tens of ms
+# to every CLI start that never touches the login path.
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Cache of parsed users.yaml keyed by (path, mtime_ns, size).
+# Repeated logins (reloaded sessions, integration tests) skip disk I/O and YAML
+# parsing as long as the file is unchanged; a different mtime/size misses the
+# cache automatically, so no manual invalidation is needed.
+_USERS_CACHE: Dict[tuple, dict[str, bytes]] = {}
+
+# Dummy hash used when the username is unknown, so a login attempt always pays
+# exactly one bcrypt.checkpw. Returning early on a missing user would leak which
+# usernames exist through response timing. Computed lazily on first use because
+# hashpw itself is intentionally slow and most sessions never hit this path.
+_DUMMY_HASH: Optional[bytes] = None
+
+
+def _get_dummy_hash() -> bytes:
+    import bcrypt
+
+    global _DUMMY_HASH
+    if _DUMMY_HASH is None:
+        _DUMMY_HASH = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=12))
+    return _DUMMY_HASH
+
+
+# Cached target bcrypt cost per target_ms value (benchmarking is done once per process).
+_TARGET_COST_CACHE: Dict[int, int] = {}
+
+
+def _parse_bcrypt_cost(stored: bytes) -> Optional[int]:
+    """
+    Extracts the cost parameter from a bcrypt hash like b"$2b$12$...".
+    The cost is the two digits after the second '$' (bytes 4-6).
+    Returns None if the hash doesn't look like a standard bcrypt string.
+    """
+    try:
+        return int(stored[4:6])
+    except (ValueError, IndexError):
+        return None
+
+
+def _target_bcrypt_cost(target_ms: int) -> int:
+    """
+    Measures once how long one bcrypt verification takes at a reference cost on this
+    machine, then extrapolates the cost needed to reach target_ms. Each +1 in cost
+    doubles the work, so the measurement at a cheap cost is enough to project the rest.
+    The result is clamped to a sane range (10..15) and cached per process.
+    """
+    import bcrypt
+
+    cached = _TARGET_COST_CACHE.get(target_ms)
+    if cached is not None:
+        return cached
+
+    ref_cost = 10
+    start = time.perf_counter()
+    bcrypt.hashpw(b"benchmark", bcrypt.gensalt(rounds=ref_cost))
+    ref_ms = (time.perf_counter() - start) * 1000.0
+
+    cost = ref_cost
+    while ref_ms < target_ms and cost < 15:
+        cost += 1
+        ref_ms *= 2.0
+
+    cost = max(10, cost)
+    _TARGET_COST_CACHE[target_ms] = cost
+    logger.info("bcrypt target cost for %dms on this machine: %d", target_ms, cost)
+    return cost
+
 
 @dataclass(frozen=True)
 class AuthConfig:
     """
     Configuration for CLI auth.
+
+    bcrypt_target_ms controls how slow a password verification should be: the bcrypt
+    cost parameter is the main performance/security knob of checkpw, and hashes created
+    on older hardware may sit below today's target. When update_user_hash is provided,
+    a successful login opportunistically re-hashes the password at the target cost and
+    hands the new hash to the callback for persistence.
     """
     enabled: bool
     users_file: Path
     max_attempts: int = 3
+    bcrypt_target_ms: int = 250
+    update_user_hash: Optional[Callable[[str, bytes], None]] = None
 
 
 class LocalAuth:
@@ -85,6 +162,7 @@ class LocalAuth:
             if self._check_credentials(users, username, password):
                 console.print(Panel(f"Welcome, {username}!", title="Login", border_style="green"))
                 logger.info("User authenticated: %s", username)
+                self._rehash_if_needed(username, password, users[username])
                 return True
 
             remaining = self.cfg.max_attempts - attempt
@@ -96,9 +174,11 @@ class LocalAuth:
         return False
 
     @staticmethod
-    def _load_users(path: Path) -> list[dict[str, Any]]:
+    def _load_users(path: Path) -> dict[str, bytes]:
         """
-        Loads users.yaml and returns the list under the 'users' key.
+        Loads users.yaml and returns a username -> password_hash mapping built from the 'users' key.
+        Using a dict gives O(1) credential lookup per attempt instead of scanning the list.
+        Hashes are stored pre-encoded as bytes, so checkpw gets them directly with no per-attempt encode().
         Example users.yaml structure:
         users:
         - username: demo
@@ -106,64 +186,117 @@ class LocalAuth:
         - username: alice
             password_hash: $2b$12$7Q9s8v1X23n4o5p6r8s9t0u1v2w3x4y5z6a7b8c9d0e1f2g3h
         Output example:
-        [
-            {"username": "demo", "password_hash": "$2b$12$KIXQ1Z5Z6ab1u9Zz8jH7OqvYpQeW8vl5eX9f1E6tZyWjHqjK"},
-            {"username": "alice", "password_hash": "$2b$12$7Q9s8v1X23n4o5p6r8s9t0u1v2w3x4y5z6a7b8c90e1f2g3h"}
-        ]
+        {
+            "demo": "$2b$12$KIXQ1Z5Z6ab1u9Zz8jH7OqvYpQeW8vl5eX9f1E6tZyWjHqjK",
+            "alice": "$2b$12$7Q9s8v1X23n4o5p6r8s9t0u1v2w3x4y5z6a7b8c90e1f2g3h"
+        }
         """
         if not path.exists():
             logger.error("users.yaml not found at: %s", str(path))
-            return []
+            return {}
+
+        # Stat BEFORE reading so a concurrent rewrite invalidates the entry on the next call
+        # instead of caching fresh content under a stale fingerprint (TOCTOU-safe ordering).
+        st = path.stat()
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _USERS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Loaded %d user(s) from users.yaml cache", len(cached))
+            return cached
+
+        import yaml
+
+        # Prefer the libyaml-backed loader (C implementation) when PyYAML was built
+        # with it: ~10-100x faster than the pure-Python SafeLoader for the same input.
+        try:
+            from yaml import CSafeLoader as yaml_loader
+        except ImportError:
+            from yaml import SafeLoader as yaml_loader
 
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=yaml_loader) or {}
         except Exception as e:
             logger.exception("Failed to read users.yaml")
-            return []
+            return {}
 
         if not isinstance(data, dict):
             logger.error("users.yaml root must be a mapping/dict")
-            return []
+            return {}
 
         users = data.get("users", [])
         if not isinstance(users, list):
             logger.error("users.yaml 'users' must be a list")
-            return []
+            return {}
 
-        # Normalize expected keys
-        normalized: list[dict[str, Any]] = []
+        # Normalize expected keys into a username -> hash-bytes mapping
+        normalized: dict[str, bytes] = {}
         for u in users:
             if not isinstance(u, dict):
                 continue
             username = str(u.get("username", "")).strip()
             password_hash = str(u.get("password_hash", "")).strip()
             if username and password_hash:
-                normalized.append({"username": username, "password_hash": password_hash})
+                normalized[username] = password_hash.encode("utf-8")
 
+        _USERS_CACHE[cache_key] = normalized
         logger.info("Loaded %d user(s) from users.yaml", len(normalized))
         return normalized
 
     @staticmethod
-    def _check_credentials(users: list[dict[str, Any]], username: str, password: str) -> bool:
+    def _check_credentials(users: dict[str, bytes], username: str, password: str) -> bool:
         """
         Checks the provided username/password against the stored bcrypt hash.
+        The users dict gives a single O(1) lookup instead of a per-entry comparison loop,
+        and the hash is already bytes so it goes straight to checkpw.
+
+        Unknown usernames are checked against a dummy hash so the attempt costs
+        exactly one bcrypt verification either way (no username enumeration via timing).
         """
-        for u in users:
-            if u["username"] != username:
-                continue
+        import bcrypt
 
-            stored = u["password_hash"]
-            try:
-                ok = bcrypt.checkpw(password.encode("utf-8"), stored.encode("utf-8"))
-            except Exception:
-                logger.exception("bcrypt check failed for username=%s", username)
-                return False
+        stored = users.get(username)
+        found = stored is not None
+        if not found:
+            stored = _get_dummy_hash()
+            logger.warning("Username not found: %s\n Check if the insert username is correct", username)
 
-            return bool(ok)
-        
-        logger.exception("Username not found: %s\n Check if the insert username is correct", username)
-        return False
+        try:
+            ok = bcrypt.checkpw(password.encode("utf-8"), stored)
+        except Exception:
+            logger.exception("bcrypt check failed for username=%s", username)
+            return False
+
+        return found and bool(ok)
+
+    def _rehash_if_needed(self, username: str, password: str, stored: bytes) -> None:
+        """
+        Opportunistically upgrades the stored hash after a successful login.
+
+        If the cost baked into the stored hash is below the cost required to hit
+        cfg.bcrypt_target_ms on this machine, the password is re-hashed at the target
+        cost and handed to the update_user_hash callback for persistence.
+        No callback configured -> no-op (we never mutate users.yaml ourselves).
+        """
+        if self.cfg.update_user_hash is None:
+            return
+
+        import bcrypt
+
+        current_cost = _parse_bcrypt_cost(stored)
+        if current_cost is None:
+            return
+
+        target_cost = _target_bcrypt_cost(self.cfg.bcrypt_target_ms)
+        if current_cost >= target_cost:
+            return
+
+        new_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=target_cost))
+        try:
+            self.cfg.update_user_hash(username, new_hash)
+            logger.info("Rehashed password for %s (cost %d -> %d)", username, current_cost, target_cost)
+        except Exception:
+            logger.exception("update_user_hash callback failed for username=%s", username)
 
 
 def maybe_login(settings: Any) -> bool:
@@ -186,5 +319,9 @@ def maybe_login(settings: Any) -> bool:
     else:
         users_path = Path("users.yaml")
 
-    cfg = AuthConfig(enabled=enable_auth, users_file=users_path)
+    cfg = AuthConfig(
+        enabled=enable_auth,
+        users_file=users_path,
+        bcrypt_target_ms=int(getattr(settings, "bcrypt_target_ms", 250)),
+    )
     return LocalAuth(cfg).login()
\ No newline at end of file
@@ -22,21 +22,22 @@ The goal is to keep app/main.py as a small bootstrapper:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
 from src.engine.query_engine import QueryEngine
 from src.engine.response import ResponseBuilder
-from src.llm.router import LLMRouter
+from src.llm.router import LLMRouter, aclose_httpx_client
 from src.config import Settings
 
-from app.commands import is_exit_command
+from app.commands import classify_local
 from app.memory import ChatMemory
 from app.render import (
     prompt_user_input,
     render_assistant_message,
-    render_dataframe_table,
-    render_sample_rows_table,
+    render_assistant_stream,
+    render_dataset_turn,
 )
 
 logger = logging.getLogger(__name__)
@@ -67,6 +68,11 @@ class ChatLoop:
         self.router = deps.router
         self.engine = deps.engine
         self.memory = deps.memory
+        # One event loop for the whole session instead of asyncio.run per turn:
+        # the router's httpx connection pool is bound to its loop, so a fresh
+        # loop every turn would pay the full TCP+TLS handshake each time and
+        # leave the previous turn's client to the garbage collector.
+        self._loop = asyncio.new_event_loop()
 
     def run(self) -> None:
         """
@@ -79,6 +85,12 @@ class ChatLoop:
         """
         logger.info("ChatLoop started (provider=%s, model=%s)", self.cfg.llm_provider, self.cfg.bedrock_model_id)
 
+        try:
+            self._run_turns()
+        finally:
+            self._close_loop()
+
+    def _run_turns(self) -> None:
         while True:
             user_text = prompt_user_input("Ask a question about marketing performance")
             if user_text is None:
@@ -91,8 +103,9 @@ class ChatLoop:
             if not user_text:
                 continue
 
-            # Local (non-LLM) exit commands: exact match only.
-            if is_exit_command(user_text):
+            # Local (non-LLM) commands: exact match only, one lookup for all kinds.
+            # Only "exit" is wired for now; reset/help fall through to the LLM pipeline.
+            if classify_local(user_text) == "exit":
                 self.memory.push_user(user_text)
                 render_assistant_message("Ok! Session closed. Come back anytime. 👋")
                 logger.info("ChatLoop ended (local exit command)")
@@ -109,8 +122,10 @@ class ChatLoop:
             # so it can use that for follow-up questions like "and what about last month?".
             last_plan_json = self.memory.last_plan_json()
 
-            # 1) Classify route
-            route = self._safe_route(user_text)
+            # 1) Classify route (for likely dataset questions the planner call is
+            # issued speculatively in parallel, hiding its round-trip behind the
+            # classifier's; the plan is dropped if the route disagrees).
+            route, plan = self._safe_route_and_plan(user_text, history_str, last_plan_json)
             logger.info("Route=%s user_text=%r", route, user_text)
 
             if route == "terminate":
@@ -122,15 +137,17 @@ class ChatLoop:
                 self._handle_meta(user_text, history_str)
                 continue
 
-            # 2) Dataset plan generation + follow-ups (LLM-only)
-            plan = self.router.build_plan(
-                provider=self.cfg.llm_provider,
-                question=user_text,
-                history=history_str,
-                last_plan_json=last_plan_json,
-                bedrock_model_id=self.cfg.bedrock_model_id,
-                aws_region=self.cfg.aws_region,
-            )
+            # 2) Dataset plan generation + follow-ups (LLM-only), unless the
+            # speculative call already produced the plan.
+            if plan is None:
+                plan = self.router.build_plan(
+                    provider=self.cfg.llm_provider,
+                    question=user_text,
+                    history=history_str,
+                    last_plan_json=last_plan_json,
+                    bedrock_model_id=self.cfg.bedrock_model_id,
+                    aws_region=self.cfg.aws_region,
+                )
 
             logger.info("Planner intent=%s metrics=%s groupby=%s", plan.intent, plan.metrics, plan.groupby)
 
@@ -145,60 +162,83 @@ class ChatLoop:
             # 3) Execute deterministically
             self._handle_dataset(plan)
 
-    def _safe_route(self, user_text: str) -> str:
+    def _safe_route_and_plan(self, user_text: str, history_str: str, last_plan_json: str):
         """
-        Wraps the LLM classifier call so the chat loop keeps running even if routing fails.
-        In case of any exception (e.g. LLM error, network blip, unexpected output), 
+        Wraps the LLM classifier (+ speculative planner) call so the chat loop keeps running even if routing fails.
+        In case of any exception (e.g. LLM error, network blip, unexpected output),
         we log the error and default to "meta" route, which is a safe fallback that can handle any user input with a generic response.
+        Returns (route, plan) where plan is None unless the speculative planner already produced one.
         """
         try:
-            return self.router.route_question(
+            return self._loop.run_until_complete(self.router.classify_and_plan(
                 provider=self.cfg.llm_provider,
                 question=user_text,
+                history=history_str,
+                last_plan_json=last_plan_json,
                 bedrock_model_id=self.cfg.bedrock_model_id,
                 aws_region=self.cfg.aws_region,
-            )
+            ))
         except Exception:
             logger.exception("Routing failed; defaulting to meta")
-            return "meta"
+            return "meta", None
+
+    def _close_loop(self) -> None:
+        """
+        Closes the router's shared HTTP client and then the session event loop.
+        Closing the client here (instead of letting GC finalize it) releases
+        the keepalive sockets deterministically and keeps -X dev runs free of
+        ResourceWarnings.
+        """
+        try:
+            self._loop.run_until_complete(aclose_httpx_client())
+        except Exception:
+            logger.exception("Closing the shared HTTP client failed")
+        finally:
+            self._loop.close()
 
     def _handle_terminate(self, user_text: str, history_str: str) -> None:
         """
-        Produces a short goodbye via the meta LLM prompt (no 'anything else' line).
+        Produces a short goodbye via the meta LLM prompt (no 'anything else' line),
+        streamed to the terminal as it decodes.
         """
         try:
-            goodbye = self.router.answer_meta(
+            goodbye = render_assistant_stream(self.router.stream_meta_answer(
                 provider=self.cfg.llm_provider,
                 question=user_text,
                 history=history_str,
                 bedrock_model_id=self.cfg.bedrock_model_id,
                 aws_region=self.cfg.aws_region,
-            ).strip()
+            )).strip()
+            if not goodbye:
+                goodbye = "Goodbye 👋"
+                render_assistant_message(goodbye)
         except Exception:
             logger.exception("Terminate meta-answer failed; using fallback goodbye")
             goodbye = "Goodbye 👋"
+            render_assistant_message(goodbye)
 
         self.memory.push_bot(goodbye)
-        render_assistant_message(goodbye)
 
     def _handle_meta(self, user_text: str, history_str: str) -> None:
         """
         Handles meta/out-of-scope/help/conversation-history questions via LLM.
+        The answer is streamed: the panel fills in as Bedrock decodes, so the
+        user sees the first tokens at network latency.
         """
         try:
-            answer = self.router.answer_meta(
+            answer = render_assistant_stream(self.router.stream_meta_answer(
                 provider=self.cfg.llm_provider,
                 question=user_text,
                 history=history_str,
                 bedrock_model_id=self.cfg.bedrock_model_id,
                 aws_region=self.cfg.aws_region,
-            ).strip()
+            )).strip()
         except Exception as e:
             logger.exception("Meta answer failed")
             answer = f"I couldn't answer that right now: {e}"
+            render_assistant_message(answer)
 
         self.memory.push_bot(answer)
-        render_assistant_message(answer)
 
     def _handle_dataset(self, plan) -> None:
         """
@@ -216,13 +256,9 @@ class ChatLoop:
             bot_text = ResponseBuilder.build_message(plan, prov, result_df)
 
             self.memory.push_bot(bot_text)
-            render_assistant_message(bot_text)
-
-            if result_df is not None:
-                render_dataframe_table(result_df, title="Result table", max_rows=self.cfg.max_render_rows)
-
-            if subset_df is not None and len(subset_df) > 0:
-                render_sample_rows_table(subset_df, title="Sample rows used (subset)")
+            # Single grouped print for the whole turn (panel + tables): one render
+            # pass and one flush instead of three separate console writes.
+            render_dataset_turn(bot_text, result_df, subset_df, max_rows=self.cfg.max_render_rows)
 
             logger.info(
                 "Dataset executed ok (intent=%s, rows_used=%d)",
@@ -20,11 +20,34 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Exact shortcuts (match-only, not substring) to avoid accidental exits.
-_EXIT_COMMANDS = {"exit", "quit", "stop", "terminate"}
+# frozenset: these are lookup-only constants, and the immutable variant is a slightly
+# smaller/faster object to probe on every user turn.
+_EXIT_COMMANDS = frozenset({"exit", "quit", "stop", "terminate"})
 
 # Optional local commands you may support later (not wired by default).
-_RESET_COMMANDS = {"reset", "clear"}
-_HELP_COMMANDS = {"help", "?"}
+_RESET_COMMANDS = frozenset({"reset", "clear"})
+_HELP_COMMANDS = frozenset({"help", "?"})
+
+# Single table for the chat loop: one normalization + one dict lookup per turn,
+# instead of running each is_*_command check (and its strip/lower pass) separately.
+_LOCAL_COMMANDS = {
+    **{cmd: "exit" for cmd in _EXIT_COMMANDS},
+    **{cmd: "reset" for cmd in _RESET_COMMANDS},
+    **{cmd: "help" for cmd in _HELP_COMMANDS},
+}
+
+
+def classify_local(text: str) -> str | None:
+    """
+    Classifies a user message as a local command in one lookup.
+
+    Returns "exit", "reset", "help", or None if the message is not an exact
+    local command and should go through the LLM pipeline.
+    """
+    kind = _LOCAL_COMMANDS.get(text.strip().lower())
+    if kind:
+        logger.debug("CLI command detected: %s (%s)", kind, text.strip().lower())
+    return kind
 
 
 def is_exit_command(text: str) -> bool:
@@ -34,7 +57,7 @@ def is_exit_command(text: str) -> bool:
     t = text.strip().lower()
     ok = t in _EXIT_COMMANDS
     if ok:
-        logger.info("CLI command detected: exit (%s)", t)
+        logger.debug("CLI command detected: exit (%s)", t)
     return ok
 
 
@@ -45,7 +68,7 @@ def is_reset_command(text: str) -> bool:
     t = text.strip().lower()
     ok = t in _RESET_COMMANDS
     if ok:
-        logger.info("CLI command detected: reset (%s)", t)
+        logger.debug("CLI command detected: reset (%s)", t)
     return ok
 
 
@@ -56,5 +79,5 @@ def is_help_command(text: str) -> bool:
     t = text.strip().lower()
     ok = t in _HELP_COMMANDS
     if ok:
-        logger.info("CLI command detected: help (%s)", t)
+        logger.debug("CLI command detected: help (%s)", t)
     return ok
\ No newline at end of file
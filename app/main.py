@@ -72,7 +72,11 @@ def main() -> None:
 
     # Core components
     router = LLMRouter()
-    engine = QueryEngine(df)
+    engine = QueryEngine(
+        df,
+        max_year=load_result.max_year,
+        max_quarter_for_max_year=load_result.max_quarter_for_max_year,
+    )
     memory = ChatMemory(max_user=cfg.max_history_user, max_bot=cfg.max_history_bot)
 
     # CLI session header
@@ -13,10 +13,15 @@ Responsibilities:
 from __future__ import annotations
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Optional
 
-from src.engine.query_plan import QueryPlan
+if TYPE_CHECKING:
+    # QueryPlan is only referenced in annotations here; importing it at runtime would
+    # pull pydantic and the whole engine chain into every module that touches memory.
+    from src.engine.query_plan import QueryPlan
 
 logger = logging.getLogger(__name__)
 
@@ -35,37 +40,59 @@ class ChatMemory:
     max_user: int = 5
     max_bot: int = 5
 
-    user_messages: List[str] = field(default_factory=list)
-    bot_messages: List[str] = field(default_factory=list)
+    # Bounded deques: maxlen gives O(1) append with automatic eviction of the oldest
+    # entry, instead of re-slicing the whole list on every push past the limit.
+    user_messages: Deque[str] = field(default_factory=deque)
+    bot_messages: Deque[str] = field(default_factory=deque)
 
     _last_plan: Optional[QueryPlan] = None
+    # JSON form of the last plan, serialized once in set_last_plan. The plan doesn't
+    # change between turns, so re-serializing it on every loop iteration is wasted work.
+    _last_plan_json: str = field(default="null", repr=False)
+
+    # Rolling buffer of preformatted "User: ...\nAssistant: ..." turns.
+    # Appending a closed turn is O(1) and history_string becomes a plain join,
+    # instead of re-slicing and re-pairing both buffers on every loop iteration.
+    # It also keeps pairs aligned even if one buffer trims before the other.
+    _turns: Deque[str] = field(default_factory=deque, repr=False)
+    _pending_user: Optional[str] = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self.user_messages = deque(self.user_messages, maxlen=self.max_user)
+        self.bot_messages = deque(self.bot_messages, maxlen=self.max_bot)
+        self._turns = deque(self._turns, maxlen=max(self.max_user, self.max_bot))
 
     def push_user(self, text: str) -> None:
         """
-        Add a user message to memory and enforce the max length.
+        Add a user message to memory; the deque maxlen enforces the bound.
         """
         self.user_messages.append(text)
-        if len(self.user_messages) > self.max_user:
-            self.user_messages = self.user_messages[-self.max_user :]
 
-        logger.info("Memory: stored user msg (count=%d)", len(self.user_messages))
+        self._pending_user = text
+        logger.debug("Memory: stored user msg (count=%d)", len(self.user_messages))
 
     def push_bot(self, text: str) -> None:
         """
-        Add an assistant message to memory and enforce the max length.
+        Add an assistant message to memory; the deque maxlen enforces the bound.
+        The assistant reply closes the current turn, which is preformatted once here.
         """
         self.bot_messages.append(text)
-        if len(self.bot_messages) > self.max_bot:
-            self.bot_messages = self.bot_messages[-self.max_bot :]
 
-        logger.info("Memory: stored bot msg (count=%d)", len(self.bot_messages))
+        if self._pending_user is not None:
+            self._turns.append(f"User: {self._pending_user}\nAssistant: {text}")
+            self._pending_user = None
+
+        logger.debug("Memory: stored bot msg (count=%d)", len(self.bot_messages))
 
     def set_last_plan(self, plan: QueryPlan) -> None:
         """
-        Store the last valid dataset plan (used for follow-ups).
+        Store the last valid dataset plan (used for follow-ups) and serialize it once.
         """
         self._last_plan = plan
-        logger.info("Memory: updated last plan (intent=%s)", getattr(plan, "intent", "unknown"))
+        # Compact JSON: the planner prompt doesn't need pretty formatting, and the
+        # indentation whitespace only inflates the prompt token count every turn.
+        self._last_plan_json = plan.model_dump_json()
+        logger.debug("Memory: updated last plan (intent=%s)", getattr(plan, "intent", "unknown"))
 
     def clear(self) -> None:
         """
@@ -73,39 +100,31 @@ class ChatMemory:
         """
         self.user_messages.clear()
         self.bot_messages.clear()
+        self._turns.clear()
+        self._pending_user = None
         self._last_plan = None
-        logger.info("Memory: cleared all state")
+        self._last_plan_json = "null"
+        logger.debug("Memory: cleared all state")
 
     def history_string(self, max_turns: int = 5) -> str:
         """
         Builds a compact conversation history string for LLM prompts.
 
-        We format paired turns:
+        Turns are already formatted as:
           User: ...
           Assistant: ...
-
-        If buffers are not the same length, we only pair what exists.
+        when push_bot closes them, so this is just a join of the last max_turns entries.
         """
-        u = self.user_messages[-max_turns:]
-        b = self.bot_messages[-max_turns:]
-
-        pairs = []
-        for i in range(min(len(u), len(b))):
-            pairs.append(f"User: {u[i]}\nAssistant: {b[i]}")
-
-        history = "\n\n".join(pairs)
-        logger.info("Memory: built history string (pairs=%d, chars=%d)", len(pairs), len(history))
+        start = max(0, len(self._turns) - max_turns)
+        history = "\n\n".join(islice(self._turns, start, None))
+        logger.debug("Memory: built history string (turns=%d, chars=%d)", len(self._turns) - start, len(history))
         return history
 
     def last_plan_json(self) -> str:
         """
         Returns the previous QueryPlan as JSON for the planner prompt,
         or "null" if no previous plan exists.
+        The string is cached by set_last_plan, so this is just an attribute read.
         """
-        if self._last_plan is None:
-            logger.info("Memory: last plan is null")
-            return "null"
-
-        txt = self._last_plan.model_dump_json(indent=2)
-        logger.info("Memory: exported last plan json (chars=%d)", len(txt))
-        return txt
\ No newline at end of file
+        logger.debug("Memory: exported last plan json (chars=%d)", len(self._last_plan_json))
+        return self._last_plan_json
\ No newline at end of file
@@ -17,19 +17,32 @@ All printing is done via Rich's Console.
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-import pandas as pd
-from rich.console import Console
+if TYPE_CHECKING:
+    # pandas is only needed here for type annotations; importing it at module load
+    # would add its full import cost to CLI startup even for turns with no tables.
+    import pandas as pd
+
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
+from rich.style import Style
 from rich.text import Text
-from rich.prompt import Prompt
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Pre-built Style objects for the per-turn panels. Passing a style name string makes
+# Rich re-parse it into a Style on every render; building them once at import keeps
+# the hot path allocation-free. Startup-only panels keep the plain string form.
+_ASSISTANT_TITLE = "Assistant"
+_ASSISTANT_STYLE = Style(color="magenta")
+_EMPTY_TABLE_STYLE = Style(color="yellow")
+
 
 def render_header(title: str) -> None:
     """
@@ -57,6 +70,21 @@ def render_info_panel(*, rows: int, min_date: str, max_date: str, provider: str,
     logger.info("Rendered info panel (rows=%d, range=%s..%s)", rows, min_date, max_date)
 
 
+@functools.lru_cache(maxsize=8)
+def _styled_prompt(prompt: str) -> str:
+    """
+    Renders the Rich-styled prompt to a plain (ANSI) string once per distinct prompt.
+
+    Prompt.ask re-parses the markup and goes through the whole console protocol on
+    every call; caching the rendered string lets the chat loop use built-in input()
+    with zero per-turn Rich overhead. When stdout is not a terminal the capture
+    yields unstyled text, so piped sessions stay clean.
+    """
+    with console.capture() as capture:
+        console.print(f"[bold blue]{prompt}[/bold blue]", end="")
+    return capture.get() + ": "
+
+
 def prompt_user_input(prompt: str) -> Optional[str]:
     """
     Reads a user message from the terminal.
@@ -66,9 +94,9 @@ def prompt_user_input(prompt: str) -> Optional[str]:
     - None if input stream is closed (EOF / Ctrl+D)
     """
     try:
-        return Prompt.ask(f"[bold blue]{prompt}[/bold blue]")
+        return input(_styled_prompt(prompt))
     except (EOFError, KeyboardInterrupt):
-        logger.info("User input interrupted (EOF/KeyboardInterrupt)")
+        logger.debug("User input interrupted (EOF/KeyboardInterrupt)")
         return None
 
 
@@ -76,8 +104,25 @@ def render_assistant_message(text: str) -> None:
     """
     Prints assistant output as a magenta panel.
     """
-    console.print(Panel(text, title="Assistant", border_style="magenta"))
-    logger.info("Rendered assistant message (chars=%d)", len(text))
+    console.print(Panel(text, title=_ASSISTANT_TITLE, border_style=_ASSISTANT_STYLE))
+    logger.debug("Rendered assistant message (chars=%d)", len(text))
+
+
+def render_assistant_stream(chunks: Iterable[str]) -> str:
+    """
+    Renders assistant output incrementally from a text-chunk iterator (see
+    LLMRouter.stream_meta_answer): the magenta panel grows as chunks arrive,
+    so the user sees the first tokens at network latency instead of waiting
+    for the full answer. Returns the complete text for memory bookkeeping.
+    """
+    pieces: list[str] = []
+    with Live(console=console, refresh_per_second=8) as live:
+        for chunk in chunks:
+            pieces.append(chunk)
+            live.update(Panel("".join(pieces), title=_ASSISTANT_TITLE, border_style=_ASSISTANT_STYLE))
+    text = "".join(pieces)
+    logger.debug("Rendered assistant stream (chars=%d)", len(text))
+    return text
 
 
 def _df_to_rich_table(df: pd.DataFrame, *, title: str, max_rows: int = 20) -> Table:
@@ -91,10 +136,16 @@ def _df_to_rich_table(df: pd.DataFrame, *, title: str, max_rows: int = 20) -> Ta
     for col in df.columns:
         table.add_column(str(col))
 
-    safe_df = df.head(max_rows)
-    for _, row in safe_df.iterrows():
+    # iloc slicing returns a view on the underlying blocks (head() materializes a copy);
+    # read-only is fine here because we immediately stringify into a fresh numpy array.
+    safe_df = df.iloc[:max_rows]
+    # Stringify the whole view in one vectorized pass and iterate the resulting
+    # numpy array: iterrows() would materialize a Series per row plus a str() per cell.
+    # astype(str) leaves missing values as float NaN (not the string "nan"),
+    # which Rich refuses to render, so fill them after the cast.
+    for row in safe_df.astype(str).fillna("nan").to_numpy():
         # * to unpack the row values as separate arguments to add_row
-        table.add_row(*[str(v) for v in row.values])
+        table.add_row(*row)
 
     if len(df) > max_rows:
         table.caption = f"Showing first {max_rows} of {len(df)} rows"
@@ -107,12 +158,41 @@ def render_dataframe_table(df: pd.DataFrame, *, title: str = "Result table", max
     Falls back to a message if the dataframe is empty.
     """
     if df is None or len(df) == 0:
-        console.print(Panel("No rows to display.", title=title, border_style="yellow"))
-        logger.info("Rendered empty dataframe table: %s", title)
+        console.print(Panel("No rows to display.", title=title, border_style=_EMPTY_TABLE_STYLE))
+        logger.debug("Rendered empty dataframe table: %s", title)
         return
 
     console.print(_df_to_rich_table(df, title=title, max_rows=max_rows))
-    logger.info("Rendered dataframe table: %s (rows=%d, cols=%d)", title, len(df), len(df.columns))
+    logger.debug("Rendered dataframe table: %s (rows=%d, cols=%d)", title, len(df), len(df.columns))
+
+
+def render_dataset_turn(
+    bot_text: str,
+    result_df: Optional[pd.DataFrame],
+    subset_df: Optional[pd.DataFrame],
+    *,
+    max_rows: int = 20,
+) -> None:
+    """
+    Renders a full dataset turn (assistant panel + result table + provenance sample)
+    as a single console write.
+
+    Grouping the renderables means one styled render pass and one flush to the
+    terminal, instead of up to three separate prints per turn.
+    """
+    renderables = [Panel(bot_text, title=_ASSISTANT_TITLE, border_style=_ASSISTANT_STYLE)]
+
+    if result_df is not None:
+        if len(result_df) == 0:
+            renderables.append(Panel("No rows to display.", title="Result table", border_style=_EMPTY_TABLE_STYLE))
+        else:
+            renderables.append(_df_to_rich_table(result_df, title="Result table", max_rows=max_rows))
+
+    if subset_df is not None and len(subset_df) > 0:
+        renderables.append(_sample_rows_view_table(subset_df, title="Sample rows used (subset)", max_rows=5))
+
+    console.print(Group(*renderables))
+    logger.debug("Rendered dataset turn (renderables=%d)", len(renderables))
 
 
 def render_sample_rows_table(df: pd.DataFrame, *, title: str = "Sample rows used (subset)", max_rows: int = 5) -> None:
@@ -122,17 +202,25 @@ def render_sample_rows_table(df: pd.DataFrame, *, title: str = "Sample rows used
     It is possible to show only a few key columns. In this example we show, if they exist, all the columns.
     """
     if df is None or len(df) == 0:
-        console.print(Panel("No subset rows to display.", title=title, border_style="yellow"))
-        logger.info("Rendered empty subset table")
+        console.print(Panel("No subset rows to display.", title=title, border_style=_EMPTY_TABLE_STYLE))
+        logger.debug("Rendered empty subset table")
         return
 
+    console.print(_sample_rows_view_table(df, title=title, max_rows=max_rows))
+    logger.debug("Rendered subset sample table (rows=%d)", min(len(df), max_rows))
+
+
+def _sample_rows_view_table(df: pd.DataFrame, *, title: str, max_rows: int) -> Table:
+    """
+    Builds the provenance sample table, restricted to the preferred columns when present.
+    """
     preferred_cols = [
         "row_id", "date", "year", "quarter", "month",
         "country", "product", "media_category", "campaign_name",
         "revenue", "cost", "profit",
     ]
-    cols = [c for c in preferred_cols if c in df.columns]
-    view = df[cols].head(max_rows) if cols else df.head(max_rows)
-
-    console.print(_df_to_rich_table(view, title=title, max_rows=max_rows))
-    logger.info("Rendered subset sample table (rows=%d, cols=%d)", len(view), len(view.columns))
\ No newline at end of file
+    # One set build makes the membership tests O(1) instead of probing the Index per column.
+    existing = set(df.columns)
+    cols = [c for c in preferred_cols if c in existing]
+    view = df[cols].iloc[:max_rows] if cols else df.iloc[:max_rows]
+    return _df_to_rich_table(view, title=title, max_rows=max_rows)
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+scripts/bake_prompts.py
+
+Bakes src/llm/prompts.yaml into src/llm/prompts_data.py.
+
+Reading and YAML-parsing prompts.yaml is a cold-start tax on every CLI run.
+Baking the prompts into a plain Python module turns that load into a normal
+import: the interpreter caches the compiled .pyc, so after the first run the
+prompts cost essentially nothing to load and no YAML library is touched.
+
+Run this after editing prompts.yaml and commit the regenerated module:
+
+    python scripts/bake_prompts.py
+
+LLMRouter falls back to parsing the YAML file when prompts_data.py is missing
+(or when an explicit prompts_path is passed), so skipping the bake only costs
+the YAML parse, never correctness.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROMPTS_YAML = REPO_ROOT / "src" / "llm" / "prompts.yaml"
+PROMPTS_MODULE = REPO_ROOT / "src" / "llm" / "prompts_data.py"
+
+HEADER = '''"""
+src/llm/prompts_data.py
+
+GENERATED by scripts/bake_prompts.py from prompts.yaml — do not edit by hand.
+Regenerate after changing prompts.yaml:
+
+    python scripts/bake_prompts.py
+"""
+
+PROMPTS: dict[str, str] = {
+'''
+
+
+def main() -> int:
+    data = yaml.safe_load(PROMPTS_YAML.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        print(f"error: {PROMPTS_YAML} must contain a mapping at the top level", file=sys.stderr)
+        return 1
+
+    lines = [HEADER]
+    for key in sorted(data):
+        value = data[key]
+        if not isinstance(value, str):
+            print(f"error: prompt {key!r} is not a string", file=sys.stderr)
+            return 1
+        lines.append(f"    {key!r}: {value!r},\n")
+    lines.append("}\n")
+
+    PROMPTS_MODULE.write_text("".join(lines), encoding="utf-8")
+    print(f"Baked {len(data)} prompts into {PROMPTS_MODULE.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
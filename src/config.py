@@ -9,6 +9,7 @@ Used to keep config in one place so the app is easy to run in different environm
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Literal, Optional
@@ -39,6 +40,7 @@ class Settings:
     enable_auth: bool = True  # Optional login gate for the CLI (enabled by default)
     users_file: Optional[str] = None  # Path to users.yaml (only needed if enable_auth=True)
     max_render_rows: int = 20  # Max number of rows to render in the CLI tables
+    bcrypt_target_ms: int = 250  # Target bcrypt verify time; stored hashes below this cost are rehashed on login
 
     @staticmethod
     def _get_int(name: str, default: int) -> int:
@@ -84,11 +86,17 @@ class Settings:
             enable_auth=cls._get_bool("ENABLE_AUTH", True),
             users_file=os.getenv("USERS_FILE", "users.yaml"),
             max_render_rows=cls._get_int("MAX_RENDER_ROWS", 20),
+            bcrypt_target_ms=cls._get_int("BCRYPT_TARGET_MS", 250),
         )
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Single entry point used by the app.
+
+    The parsed Settings is cached: the environment does not change while the
+    process runs, and the dataclass is frozen, so sharing the one instance is
+    safe. Tests that mutate the environment can call get_settings.cache_clear().
     """
     return Settings.from_env()
@@ -42,6 +42,10 @@ RENAME_MAP: Dict[str, str] = {
 
 NUMERIC_COLUMNS = ["year", "quarter", "month", "week", "revenue", "cost"]
 DATE_COLUMN = "date"
+# Known strftime format of the Date column. Passing it to pd.to_datetime skips
+# pandas' per-value format inference; None re-enables inference for datasets
+# where the format is not known upfront.
+DATE_FORMAT = "%Y-%m-%d"
 
 DIMENSIONS = [
     "year", "quarter", "month", "week",
@@ -73,6 +77,7 @@ class DatasetSchema:
     date_column: str
     dimensions: List[str]
     row_id_hash_columns: List[str]
+    date_format: str | None = DATE_FORMAT
 
     @classmethod
     def marketing_default(cls) -> DatasetSchema:
@@ -83,5 +88,6 @@ class DatasetSchema:
             date_column=DATE_COLUMN,
             dimensions=DIMENSIONS,
             row_id_hash_columns=ROW_ID_HASH_COLUMNS,
+            date_format=DATE_FORMAT,
         )
         
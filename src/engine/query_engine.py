@@ -17,10 +17,15 @@ It is also added an execution method that returns:
 
 from __future__ import annotations
 
+import functools
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any, Dict
+
+import numpy as np
 import pandas as pd
 
-from .query_plan import QueryPlan
+from .query_plan import QueryPlan, QueryPlanSpec
 
 
 @dataclass(frozen=True)
@@ -42,46 +47,155 @@ class QueryEngine:
     - profit column present
     The output is a pandas DataFrame.
     """
-    def __init__(self, df: pd.DataFrame) -> None:
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        *,
+        max_year: int | None = None,
+        max_quarter_for_max_year: int | None = None,
+    ) -> None:
         self.df = df
+        # Cache the dataset's latest year/quarter once: "last_quarter" queries would
+        # otherwise re-scan the year and quarter columns on every execution.
+        # The loader already computed these (LoadResult); if the caller doesn't pass
+        # them we derive them here a single time.
+        if max_year is None:
+            max_year = int(df["year"].max())
+        if max_quarter_for_max_year is None:
+            max_quarter_for_max_year = int(df.loc[df["year"] == max_year, "quarter"].max())
+        self.max_year = max_year
+        self.max_quarter_for_max_year = max_quarter_for_max_year
+        self._dim_indexes = self._build_dim_indexes(df)
+        self._year_offsets, self._year_quarter_offsets = self._build_time_offsets(df)
+        # LRU cache of executed plans keyed by their canonical JSON. Follow-up turns
+        # often re-run the exact same plan (e.g. "show that again"), and the frame is
+        # immutable for the lifetime of the engine, so results can be reused as-is.
+        self._result_cache: OrderedDict[str, ExecutionResult] = OrderedDict()
+        self._result_cache_maxsize = 128
+
+    @staticmethod
+    def _build_dim_indexes(df: pd.DataFrame) -> Dict[str, Dict[Any, np.ndarray]]:
+        """
+        Builds an inverted index (value -> sorted array of row labels) for every
+        categorical dimension, once at construction time.
+
+        Equality filters then become posting-list intersections instead of full
+        boolean scans over the column: for selective filters (a product matching 1%
+        of rows) this avoids touching the other 99%.
+
+        The scan done here happens once per column, not once per query, and it is
+        a plain integer comparison on the contiguous int8/int16 codes buffer
+        (codes == code) rather than a per-row string comparison: the value-to-code
+        lookup is hoisted out of the loop entirely.
+        """
+        indexes: Dict[str, Dict[Any, np.ndarray]] = {}
+        labels = df.index.to_numpy()
+        for col in df.columns:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                continue
+            codes = df[col].cat.codes.to_numpy()
+            indexes[col] = {
+                value: labels[np.flatnonzero(codes == code)]
+                for code, value in enumerate(df[col].cat.categories)
+            }
+        return indexes
+
+    @staticmethod
+    def _build_time_offsets(df: pd.DataFrame):
+        """
+        Precomputes [start, end) row positions per year and per (year, quarter).
+
+        The loader sorts the frame by date, which makes year (and quarter within a
+        year) non-decreasing, so every year/quarter range is one contiguous block
+        and searchsorted finds its bounds in O(log N). Year and quarter time-range
+        filters then become zero-copy iloc slices instead of boolean-mask scans.
+        Returns (None, None) when the frame is not date-sorted (e.g. an engine
+        built on an ad-hoc frame), in which case the mask path is used.
+        """
+        if not df["date"].is_monotonic_increasing:
+            return None, None
+
+        years = df["year"].to_numpy()
+        quarters = df["quarter"].to_numpy()
+
+        uniq_years = np.unique(years)
+        year_offsets = {
+            int(y): (int(s), int(e))
+            for y, s, e in zip(
+                uniq_years,
+                np.searchsorted(years, uniq_years, side="left"),
+                np.searchsorted(years, uniq_years, side="right"),
+            )
+        }
+
+        # Encode (year, quarter) into one monotonic key so searchsorted applies.
+        yq = years.astype(np.int32) * 4 + (quarters.astype(np.int32) - 1)
+        uniq_yq = np.unique(yq)
+        year_quarter_offsets = {
+            (int(k) // 4, int(k) % 4 + 1): (int(s), int(e))
+            for k, s, e in zip(
+                uniq_yq,
+                np.searchsorted(yq, uniq_yq, side="left"),
+                np.searchsorted(yq, uniq_yq, side="right"),
+            )
+        }
+        return year_offsets, year_quarter_offsets
 
     def execute_with_subset(self, plan: QueryPlan) -> ExecutionResult:
         """
         Executes the QueryPlan and returns both the result DataFrame and the filtered subset used for provenance sampling.
         Useful for ensuring that provenance reflects the exact data used to produce the result.
+        Identical plans are served from a small LRU cache instead of re-executing.
         """
-        subset = self._apply_time_range(self.df, plan)
-        subset = self._apply_filters(subset, plan)
-
-        if plan.intent == "aggregate":
-            res = self._run_aggregate(subset, plan)
-        elif plan.intent == "top_n":
-            res = self._run_top_n(subset, plan)
-        elif plan.intent == "trend":
-            res = self._run_trend(subset, plan)
+        cache_key = plan.model_dump_json()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return cached
+
+        # Validation happened at the LLM boundary; from here on the engine works
+        # on the plain slotted-dataclass form of the plan.
+        spec = plan.to_spec()
+        subset = self._apply_time_range(self.df, spec)
+        subset = self._apply_filters(subset, spec)
+
+        if spec.intent == "aggregate":
+            res = self._run_aggregate(subset, spec)
+        elif spec.intent == "top_n":
+            res = self._run_top_n(subset, spec)
+        elif spec.intent == "trend":
+            res = self._run_trend(subset, spec)
         else:
-            raise ValueError(f"Unsupported intent: {plan.intent}")
+            raise ValueError(f"Unsupported intent: {spec.intent}")
 
-        return ExecutionResult(result_df=res, subset_df=subset)
+        result = ExecutionResult(result_df=res, subset_df=subset)
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self._result_cache_maxsize:
+            self._result_cache.popitem(last=False)
+        return result
 
     def execute(self, plan: QueryPlan) -> pd.DataFrame:
         return self.execute_with_subset(plan).result_df
 
-    @staticmethod
-    def _apply_time_range(df: pd.DataFrame, plan: QueryPlan) -> pd.DataFrame:
+    def _apply_time_range(self, df: pd.DataFrame, plan: QueryPlanSpec) -> pd.DataFrame:
         tr = plan.time_range
         if tr.type == "all":
             return df
         if tr.type == "year":
             if tr.year is None:
                 raise ValueError("time_range.year is required for type=year")
+            if self._year_offsets is not None and df is self.df:
+                bounds = self._year_offsets.get(tr.year)
+                if bounds is None:
+                    return df.iloc[0:0]
+                return df.iloc[bounds[0]:bounds[1]]
             return df[df["year"] == tr.year]
         if tr.type == "quarter":
             if tr.year is None or tr.quarter is None:
                 raise ValueError("time_range.year and time_range.quarter are required for type=quarter")
-            return df[(df["year"] == tr.year) & (df["quarter"] == tr.quarter)]
+            return self._slice_year_quarter(df, tr.year, tr.quarter)
         if tr.type == "last_quarter":
-            return QueryEngine._slice_last_quarter(df)
+            return self._slice_last_quarter(df)
         if tr.type == "last_n_years":
             if tr.year is None:
                 raise ValueError("time_range.year is required for type=last_n_years")
@@ -92,26 +206,63 @@ class QueryEngine:
             return df
         return df
 
-    @staticmethod
-    def _slice_last_quarter(df: pd.DataFrame) -> pd.DataFrame:
-        max_year = int(df["year"].max())
-        max_q = int(df[df["year"] == max_year]["quarter"].max())
+    def _slice_year_quarter(self, df: pd.DataFrame, year: int, quarter: int) -> pd.DataFrame:
+        # Zero-copy contiguous slice via the precomputed offsets when the frame is
+        # date-sorted; boolean-mask fallback otherwise.
+        if self._year_quarter_offsets is not None and df is self.df:
+            bounds = self._year_quarter_offsets.get((year, quarter))
+            if bounds is None:
+                return df.iloc[0:0]
+            return df.iloc[bounds[0]:bounds[1]]
+        return df[(df["year"] == year) & (df["quarter"] == quarter)]
+
+    def _slice_last_quarter(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Uses the max year/quarter cached at construction time instead of scanning
+        # the full year and quarter columns on every "last quarter" query.
+        max_year = self.max_year
+        max_q = self.max_quarter_for_max_year
         if max_q == 1:
             y, q = max_year - 1, 4
         else:
             y, q = max_year, max_q - 1
-        return df[(df["year"] == y) & (df["quarter"] == q)]
+        return self._slice_year_quarter(df, y, q)
+
+    def _apply_filters(self, df: pd.DataFrame, plan: QueryPlanSpec) -> pd.DataFrame:
+        """
+        Applies the plan's equality filters.
+
+        Filters on indexed (categorical) dimensions are resolved via the prebuilt
+        posting lists and reduced with np.intersect1d; only non-indexed fields
+        (e.g. numeric time columns) fall back to a boolean-mask scan.
+        """
+        if not plan.filters:
+            return df
 
-    @staticmethod
-    def _apply_filters(df: pd.DataFrame, plan: QueryPlan) -> pd.DataFrame:
         out = df
+        posting_lists = []
         for f in plan.filters:
-            if f.op == "=":
+            if f.op != "=":
+                continue
+            index = self._dim_indexes.get(f.field)
+            if index is not None:
+                rows = index.get(f.value)
+                if rows is None:
+                    # Unknown dimension value: nothing can match.
+                    return df.iloc[0:0]
+                posting_lists.append(rows)
+            else:
                 out = out[out[f.field] == f.value]
+
+        if posting_lists:
+            # Posting lists cover the full frame; intersecting with the surviving row
+            # labels keeps the time-range (and any mask-based) restrictions applied.
+            posting_lists.append(out.index.to_numpy())
+            rows = functools.reduce(np.intersect1d, posting_lists)
+            out = out.loc[rows]
         return out
 
     @staticmethod
-    def _run_aggregate(df: pd.DataFrame, plan: QueryPlan) -> pd.DataFrame:
+    def _run_aggregate(df: pd.DataFrame, plan: QueryPlanSpec) -> pd.DataFrame:
         """
         User request example: "What is the total revenue and profit for Q1 2023?"
             - intent: aggregate
@@ -129,10 +280,12 @@ class QueryEngine:
         agg_map = {m: "sum" for m in plan.metrics} #useful to use df.agg with multiple metrics
         if not plan.groupby:
             return df.agg(agg_map).to_frame().T # transpose to have a row and to_frame returns a DataFrame instead of a Series
-        return df.groupby(plan.groupby, dropna=False).agg(agg_map).reset_index()
+        # observed=True: with categorical dimensions, the default would materialize the
+        # cartesian product of all category levels across keys (mostly empty groups).
+        return df.groupby(plan.groupby, dropna=False, observed=True).agg(agg_map).reset_index()
 
     @staticmethod
-    def _run_top_n(df: pd.DataFrame, plan: QueryPlan) -> pd.DataFrame:
+    def _run_top_n(df: pd.DataFrame, plan: QueryPlanSpec) -> pd.DataFrame:
         """
         User request example: "What are the top 5 campaigns by revenue in Q2 2023?"
          - intent: top_n
@@ -153,15 +306,15 @@ class QueryEngine:
         metrics = plan.metrics or ["revenue"]
         agg_map = {m: "sum" for m in metrics}
 
-        res = df.groupby(plan.groupby, dropna=False).agg(agg_map).reset_index()
-        res = res.sort_values(
-            by=plan.sort_by.field,
-            ascending=(plan.sort_by.direction == "asc"),
-        )
-        return res.head(plan.top_n)
+        res = df.groupby(plan.groupby, dropna=False, observed=True).agg(agg_map).reset_index()
+        # nlargest/nsmallest heap-select the top k in O(G log k) instead of fully
+        # sorting all G groups just to keep the first few rows.
+        if plan.sort_by.direction == "asc":
+            return res.nsmallest(plan.top_n, plan.sort_by.field)
+        return res.nlargest(plan.top_n, plan.sort_by.field)
 
     @staticmethod
-    def _run_trend(df: pd.DataFrame, plan: QueryPlan) -> pd.DataFrame:
+    def _run_trend(df: pd.DataFrame, plan: QueryPlanSpec) -> pd.DataFrame:
         """
         User request example: "What is the monthly revenue trend for 2023?"
          - intent: trend
@@ -175,7 +328,7 @@ class QueryEngine:
         group = plan.groupby or ["year", "month"]
         metrics = plan.metrics or ["revenue", "cost"]
         agg_map = {m: "sum" for m in metrics}
-        res = df.groupby(group, dropna=False).agg(agg_map).reset_index()
+        res = df.groupby(group, dropna=False, observed=True).agg(agg_map).reset_index()
         if "year" in group and "month" in group:
             return res.sort_values(["year", "month"])
         return res.sort_values(group)
\ No newline at end of file
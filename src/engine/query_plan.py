@@ -11,6 +11,7 @@ Then QueryPlan is executed on the pandas DataFrame by query_engine.py.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 from pydantic import BaseModel, Field
 
@@ -37,6 +38,48 @@ GroupByField = Literal[
 ]
 
 
+# ---------------------------------------------------------------------------
+# Engine-internal plan representation.
+#
+# The pydantic models below validate/coerce LLM JSON at the boundary, but that
+# validation machinery (dict-backed attributes, per-field validators) is pure
+# overhead once a plan is trusted. The engine works on these frozen slotted
+# dataclasses instead: plain C-level attribute access, no validation frames.
+# Convert with QueryPlan.to_spec().
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class TimeRangeSpec:
+    type: str = "all"
+    year: Optional[int] = None
+    quarter: Optional[int] = None
+    n_years: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class FilterSpec:
+    field: str
+    op: str = "="
+    value: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class SortBySpec:
+    field: str
+    direction: str = "desc"
+
+
+@dataclass(frozen=True, slots=True)
+class QueryPlanSpec:
+    intent: str = "unknown"
+    metrics: list[str] = field(default_factory=list)
+    groupby: list[str] = field(default_factory=list)
+    time_range: TimeRangeSpec = field(default_factory=TimeRangeSpec)
+    filters: list[FilterSpec] = field(default_factory=list)
+    top_n: Optional[int] = None
+    sort_by: Optional[SortBySpec] = None
+
+
 class TimeRange(BaseModel):
     """
     A time slice used to restrict the dataset.
@@ -100,3 +143,19 @@ class QueryPlan(BaseModel):
 
     top_n: Optional[int] = None
     sort_by: Optional[SortBy] = None
+
+    def to_spec(self) -> QueryPlanSpec:
+        """
+        Copies the validated plan into the engine-internal dataclass form.
+        """
+        tr = self.time_range
+        sb = self.sort_by
+        return QueryPlanSpec(
+            intent=self.intent,
+            metrics=list(self.metrics),
+            groupby=list(self.groupby),
+            time_range=TimeRangeSpec(type=tr.type, year=tr.year, quarter=tr.quarter, n_years=tr.n_years),
+            filters=[FilterSpec(field=f.field, op=f.op, value=f.value) for f in self.filters],
+            top_n=self.top_n,
+            sort_by=None if sb is None else SortBySpec(field=sb.field, direction=sb.direction),
+        )
@@ -15,19 +15,312 @@ All LLM calls are expected to return plain text; JSON outputs are parsed with a
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import hashlib
 import json
 import re
+import weakref
 from pathlib import Path
-from typing import Any, Optional, Dict
+from typing import Any, Iterator, Optional, Dict
 
 import boto3
+import botocore.config
+import cachetools
 import yaml
-import logging 
+import logging
+from urllib.parse import quote
 
-from src.engine.query_plan import QueryPlan
+from src.engine.query_plan import QueryPlan, TimeRange
 
 logger = logging.getLogger(__name__)
 
+# Context-scoped debug capture. An instance dict mutated on every call would
+# leak entries between concurrent consumers sharing one router; a ContextVar
+# scopes the capture dict without any locking. Task context copies are shallow
+# — a dict installed before tasks are spawned is the same object inside them —
+# so entries written in asyncio.run/gather tasks stay visible to the caller
+# that installed the dict, while contexts that install their own dict (e.g.
+# one per server request) remain isolated from each other.
+_DEBUG_CTX: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "router_debug", default=None
+)
+
+# libyaml-backed loader when available: the C parser is an order of magnitude
+# faster than pure-Python PyYAML, which matters for cold start in CLI runs.
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_prompts_file(path: str, mtime_ns: int) -> dict:
+    """
+    Parses a prompts YAML file once per (path, mtime): routers built on the same
+    unchanged file share the parsed dict instead of re-reading it, and the mtime
+    in the cache key invalidates the entry when the file is edited.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    if not isinstance(data, dict):
+        raise ValueError("prompts.yaml must contain a mapping at the top level.")
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _get_bedrock_client(region: str):
+    """
+    Returns a shared bedrock-runtime client for the region.
+
+    Constructing a boto3 client loads and parses the service/endpoint JSON
+    models and registers handlers — tens to hundreds of ms that used to be paid
+    on every LLM call. Caching makes that a one-shot cost per region, and the
+    shared connection pool (with TCP keepalive) lets successive calls reuse the
+    same TLS connection instead of re-handshaking.
+    """
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=region,
+        config=botocore.config.Config(
+            retries={"max_attempts": 2, "mode": "standard"},
+            tcp_keepalive=True,
+            max_pool_connections=32,
+        ),
+    )
+
+
+# Optional direct-HTTP async Bedrock path: signing InvokeModel requests with
+# SigV4 and POSTing them over a shared httpx.AsyncClient skips boto3's
+# serializer/event-hook/response-parser machinery on every call — only the
+# signature itself is computed per request. h2 upgrades the client to HTTP/2
+# (header compression, one multiplexed connection); without it httpx stays on
+# HTTP/1.1 with keepalive, which is still a pooled warm TLS connection.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (probe only: httpx needs it for http2=True)
+    _HTTPX_HTTP2 = True
+except ImportError:
+    _HTTPX_HTTP2 = False
+
+
+# One client per event loop, not per process: httpx keepalive connections are
+# bound to the loop they were created on, and reusing a previous loop's
+# connection raises "Event loop is closed". The chat loop keeps a single loop
+# alive for the whole session (so the pool genuinely spans turns) and awaits
+# aclose_httpx_client() on shutdown; weak keys cover any other short-lived
+# loops (asyncio.run in scripts/tests), letting their client be collected
+# with the loop.
+_HTTPX_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_httpx_client() -> "httpx.AsyncClient":
+    """
+    Async HTTP client for direct Bedrock calls, shared within the running
+    event loop. The long keepalive expiry keeps the TLS connection warm across
+    successive calls on the same loop, so they skip the TCP+TLS handshake.
+    """
+    loop = asyncio.get_running_loop()
+    client = _HTTPX_CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=_HTTPX_HTTP2,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=300.0),
+        )
+        _HTTPX_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_httpx_client() -> None:
+    """
+    Closes the running loop's shared httpx client, releasing its keepalive
+    connections. Call this from the loop that made the requests, before
+    closing it; relying on GC finalizers instead leaks the sockets until
+    collection and emits ResourceWarnings under -X dev. A no-op when the
+    loop never made a direct HTTP call.
+    """
+    client = _HTTPX_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_aws_credentials():
+    """
+    Resolves AWS credentials once per process (env vars / profile / IMDS — the
+    same chain boto3 uses). Returns None when no credentials are configured,
+    in which case the direct-HTTP path is skipped in favor of boto3, whose
+    error reporting for missing credentials is clearer.
+    """
+    import botocore.session
+    return botocore.session.Session().get_credentials()
+
+
+# Optional async Bedrock path: aioboto3 provides a native non-blocking client,
+# so concurrent stages (e.g. classifier + planner) overlap on the event loop.
+# When it is not installed, the async methods fall back to running the sync
+# client in a worker thread, which still overlaps the network round-trips.
+try:
+    import aioboto3
+    _AIOBOTO3_SESSION = aioboto3.Session()
+except ImportError:
+    _AIOBOTO3_SESSION = None
+
+
+# Model families that have a latency-optimized serving variant on Bedrock.
+# Other models reject the performanceConfigLatency parameter, so it is only
+# sent when the model id matches this allowlist.
+_LATENCY_OPTIMIZED_MODEL_TOKENS = ("claude-3-5-haiku", "llama3-1-70b", "llama3-1-405b")
+
+
+def _supports_latency_optimized(model_id: str) -> bool:
+    return any(token in model_id for token in _LATENCY_OPTIMIZED_MODEL_TOKENS)
+
+
+# Model families that accept Anthropic prompt-caching (cache_control) blocks on
+# Bedrock: 3.5 Haiku, 3.7 Sonnet and the 4.x families. Everything else —
+# including 3.5 Sonnet v1, the repo's default planner model — rejects the
+# field with a ValidationException, so it is only sent on an allowlist match.
+_PROMPT_CACHE_MODEL_TOKENS = ("claude-3-5-haiku", "claude-3-7", "claude-sonnet-4", "claude-opus-4", "claude-haiku-4")
+
+
+def _supports_prompt_cache(model_id: str) -> bool:
+    return any(token in model_id for token in _PROMPT_CACHE_MODEL_TOKENS)
+
+
+def _claude_payload(
+    *,
+    model_id: str,
+    system: str,
+    user: str,
+    max_tokens: int,
+    temperature: float,
+) -> Dict[str, Any]:
+    """
+    Messages-API payload for Claude on Bedrock (shared by the sync, async and
+    streaming call paths). On models that support prompt caching the system
+    prompt — the large stable prefix — is marked with an ephemeral
+    cache_control block, so Bedrock reuses its prefill across calls at a
+    fraction of the input-token cost. The user templates keep their variable
+    content ({question}, {history}) last for the same prefix-matching reason.
+    """
+    system_field: Any = system
+    if _supports_prompt_cache(model_id):
+        system_field = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": int(max_tokens),
+        "temperature": float(temperature),
+        "system": system_field,
+        "messages": [
+            {"role": "user", "content": user}
+        ],
+    }
+
+
+# orjson's C parser/serializer is several times faster than the stdlib for the
+# small JSON documents exchanged with the LLM; the stdlib is a drop-in fallback
+# when it's missing. _json_dumps_bytes returns bytes directly (orjson's native
+# output), which is exactly what the Bedrock body parameter wants — no separate
+# str -> bytes encode step.
+try:
+    import orjson
+
+    def _json_loads(text: str | bytes) -> Any:
+        return orjson.loads(text)
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Prompts baked into a Python module by scripts/bake_prompts.py. When present
+# it replaces the default prompts.yaml read entirely; prompts.yaml stays the
+# dev-time source of truth and the fallback when the bake hasn't been run.
+try:
+    from src.llm.prompts_data import PROMPTS as _BAKED_PROMPTS
+except ImportError:
+    _BAKED_PROMPTS = None
+
+
+# Placeholder / escaped-brace tokens in prompt templates ({question}, {{ ... }}).
+_TMPL_TOKEN = re.compile(r"\{\{|\}\}|\{(\w+)\}")
+
+
+def _compile_template(template: str):
+    """
+    Compiles a str.format-style template into a render callable.
+
+    str.format rescans the whole template for placeholders on every call, which
+    adds up for the planner template (it embeds history, the last plan and a
+    large JSON schema example). Splitting the template once into literal
+    segments and field names reduces each render to a list join. Supports the
+    same syntax the prompts use: {name} placeholders and {{ / }} brace escapes.
+    """
+    literals: list[str] = []
+    fields: list[str] = []
+    buf: list[str] = []
+    pos = 0
+    for m in _TMPL_TOKEN.finditer(template):
+        buf.append(template[pos:m.start()])
+        pos = m.end()
+        if m.group(1) is None:
+            buf.append(m.group(0)[0])  # "{{" -> "{", "}}" -> "}"
+        else:
+            literals.append("".join(buf))
+            buf = []
+            fields.append(m.group(1))
+    buf.append(template[pos:])
+    literals.append("".join(buf))
+
+    def render(**kwargs: str) -> str:
+        out = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            out.append(kwargs[field])
+            out.append(literal)
+        return "".join(out)
+
+    return render
+
+
+# Keyword patterns for _fast_route: questions these match are classified
+# without an LLM call at all. Deliberately narrow — anything ambiguous falls
+# through to the LLM classifier, so a miss here only costs the usual RTT.
+_FAST_ROUTE_META = re.compile(
+    r"^\s*(?:hi|hello|hey|help)[\s!.?]*$"
+    r"|\bwhat can you do\b"
+    r"|\bcapabilit(?:y|ies)\b"
+    r"|\bwho are you\b"
+    r"|\bhow do you work\b"
+    r"|\b(?:conversation|chat) history\b",
+    re.IGNORECASE,
+)
+_FAST_ROUTE_DATASET = re.compile(
+    r"\b(?:20\d{2}|q[1-4]|last quarter|last \d+ years?)\b.*?\b(?:revenue|cost|profit|spend)\b"
+    r"|\b(?:revenue|cost|profit|spend)\b.*?\b(?:20\d{2}|q[1-4]|last quarter|last \d+ years?)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+# Precompiled patterns for _safe_parse_json: compiling once at import avoids the
+# per-call pattern-cache lookup and flag re-parsing on every LLM response.
+_FENCE_JSON = re.compile(r"^```json\s*", re.IGNORECASE)
+_FENCE_OPEN = re.compile(r"^```\s*")
+_FENCE_CLOSE = re.compile(r"\s*```$")
+_JSON_OBJ = re.compile(r"\{.*\}", re.DOTALL)
+
 class LLMRouter:
     """"
     LLMRouter is the main class responsible for routing user questions to the appropriate LLM prompts and parsing their responses.
@@ -44,19 +337,114 @@ class LLMRouter:
     If prompts are missing or if LLM outputs cannot be parsed/validated, the methods return safe defaults to keep the app functional.
     """
 
-    def __init__(self, prompts_path: Optional[str] = None) -> None:
+    # Per-method output budgets. Bedrock decodes (and bills) toward max_tokens,
+    # so each call gets a cap sized to its output: the classifier emits a tiny
+    # JSON object, the planner a bounded QueryPlan, and only meta answers need
+    # room for free-form prose.
+    CLASSIFIER_MAX_TOKENS = 32
+    PLANNER_MAX_TOKENS = 400
+    META_MAX_TOKENS = 800
+
+    # Model tier for the classifier and meta steps. A 3-way label and short
+    # help answers are well within Haiku's capability, and Haiku decodes far
+    # faster (and cheaper) than Sonnet on Bedrock; the planner keeps the
+    # caller-provided model, where JSON fidelity matters most.
+    CLASSIFIER_MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+
+    # Shared fallback plan for the error paths. Built once with model_construct
+    # (the inputs are trusted constants, so pydantic validation is skipped) and
+    # never mutated by callers, which only read intent.
+    _UNKNOWN_PLAN = QueryPlan.model_construct(
+        intent="unknown",
+        metrics=[],
+        groupby=[],
+        time_range=TimeRange(type="all"),
+        filters=[],
+        top_n=None,
+        sort_by=None,
+    )
+
+    def __init__(
+        self,
+        prompts_path: Optional[str] = None,
+        *,
+        performance_config: bool = True,
+        capture_debug: bool = False,
+        classifier_max_tokens: Optional[int] = None,
+        planner_max_tokens: Optional[int] = None,
+        meta_max_tokens: Optional[int] = None,
+        classifier_model_id: Optional[str] = None,
+    ) -> None:
         """
-        Initializes the LLMRouter by loading prompts from a YAML file. 
+        Initializes the LLMRouter by loading prompts from a YAML file.
         If no path is provided, it defaults to "prompts.yaml" in the same directory as this script.
+        performance_config enables Bedrock latency-optimized inference for models that support it.
+        capture_debug enables storing raw prompts/responses in debug_info for inspection.
+        The *_max_tokens arguments override the per-method output budgets
+        (CLASSIFIER_MAX_TOKENS / PLANNER_MAX_TOKENS / META_MAX_TOKENS).
+        classifier_model_id overrides the model used for the classifier and
+        meta steps (CLASSIFIER_MODEL_ID, a Haiku tier by default).
         """
         base_dir = Path(__file__).resolve().parent
         self._prompts_path = Path(prompts_path) if prompts_path else (base_dir / "prompts.yaml")
-        self.prompts = self._load_prompts(self._prompts_path)
+        if prompts_path is None and _BAKED_PROMPTS is not None:
+            # Baked prompts (see scripts/bake_prompts.py): importing a module of
+            # string literals rides on Python's cached bytecode, so the default
+            # startup path does no file read and no YAML parse at all. An
+            # explicit prompts_path still goes through the YAML loader.
+            self.prompts = _BAKED_PROMPTS
+        else:
+            self.prompts = self._load_prompts(self._prompts_path)
         self.temperature = 0.0  # default temperature for LLM calls, can be overridden in each call
         self.max_tokens = 800  # default max tokens for LLM calls, can be overridden in each call
+        self.classifier_max_tokens = classifier_max_tokens or self.CLASSIFIER_MAX_TOKENS
+        self.planner_max_tokens = planner_max_tokens or self.PLANNER_MAX_TOKENS
+        self.meta_max_tokens = meta_max_tokens or self.META_MAX_TOKENS
+        self.classifier_model_id = classifier_model_id or self.CLASSIFIER_MODEL_ID
+        self.performance_config = performance_config
+
+        # User templates compiled once at init (see _compile_template): each
+        # call renders with a list join instead of a full str.format scan.
+        self._user_renderers = {
+            key: _compile_template(value)
+            for key, value in self.prompts.items()
+            if key.endswith("_user_template") and isinstance(value, str)
+        }
+
+        # Exact-match response cache for the classifier and meta answers: the
+        # classifier's output space is tiny and common meta phrasings ("help",
+        # "what can you do") repeat, so a hit skips the Bedrock round-trip
+        # entirely. Only used for deterministic (temperature=0) calls.
+        self._response_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=1024)
 
         # Useful to inspect what the LLM returned at each step, without needing to add print statements or use a debugger.
-        self.debug_info: Dict[str, Any] = {}
+        # Only populated when capture_debug is set: copying full prompts and raw
+        # responses on every call is wasted work in normal runs. The entries
+        # live in a context-scoped dict (see _DEBUG_CTX / debug_info).
+        self.capture_debug = capture_debug
+        if capture_debug:
+            # Install the capture dict in the constructing caller's context:
+            # tasks spawned later (asyncio.run, gather, to_thread) copy the
+            # context shallowly and share this dict object, so entries written
+            # inside them stay visible to the synchronous caller. Without
+            # this, a dict first created inside a task would be discarded with
+            # the task's context copy.
+            _DEBUG_CTX.set({})
+
+    @property
+    def debug_info(self) -> Dict[str, Any]:
+        """
+        Debug entries captured for the current context (see _DEBUG_CTX).
+        Backed by a ContextVar rather than an instance attribute so concurrent
+        consumers sharing one router can each install their own capture dict;
+        __init__ installs one in the constructing context so entries written
+        inside asyncio tasks remain visible to the synchronous caller.
+        """
+        info = _DEBUG_CTX.get()
+        if info is None:
+            info = {}
+            _DEBUG_CTX.set(info)
+        return info
 
     @staticmethod
     def _load_prompts(path: Path) -> dict:
@@ -64,14 +452,41 @@ class LLMRouter:
         Reads the prompts from a YAML file and returns them as a dictionary.
         The YAML file is expected to contain a mapping at the top level, 
         with keys like "classifier_system", "classifier_user_template", "meta_system", "meta_user_template", "planner_system", and "planner_user_template".
-        If the file is missing or cannot be parsed, it raises an error. 
-        If the content is not a dictionary, it also raises an error.         
+        If the file is missing or cannot be parsed, it raises an error.
+        If the content is not a dictionary, it also raises an error.
+        Parsed files are cached module-wide (see _parse_prompts_file), so
+        constructing many routers on the same file parses it once.
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        if not isinstance(data, dict):
-            raise ValueError("prompts.yaml must contain a mapping at the top level.")
-        return data
+        resolved = path.resolve()
+        return _parse_prompts_file(str(resolved), resolved.stat().st_mtime_ns)
+
+    def _response_cache_key(self, kind: str, system: str, user: str) -> Optional[str]:
+        """
+        Cache key for deterministic calls; returns None (caching disabled) when
+        temperature > 0 makes responses non-deterministic.
+        """
+        if self.temperature > 0:
+            return None
+        return hashlib.sha256(f"{kind}\x00{system}\x00{user}".encode("utf-8")).hexdigest()
+
+    def _fast_route(self, question: str) -> Optional[str]:
+        """
+        Keyword-based classifier for the obvious cases: greetings/help phrasing
+        is meta, and a time token plus a metric noun ("revenue in 2023",
+        "profit last quarter") is a dataset question. A match skips the Bedrock
+        classifier round-trip entirely; None means "let the LLM decide".
+        """
+        if _FAST_ROUTE_META.search(question):
+            route = "meta"
+        elif _FAST_ROUTE_DATASET.search(question):
+            route = "dataset"
+        else:
+            return None
+
+        if self.capture_debug:
+            self.debug_info["classifier_route"] = route
+        logger.debug("Fast-path route=%s", route)
+        return route
 
     def route_question(
         self,
@@ -87,34 +502,189 @@ class LLMRouter:
             - meta: the question is about the chatbot capabilities, or is a follow-up that requires context, or is out-of-scope but we want to answer gracefully via LLM
             - out_of_scope: the question is not answerable (e.g. "What is the weather today?") and we want to say "Sorry, I can only answer questions about the marketing dataset" instead of trying to query the dataset or generating a plan.
         """
+        fast = self._fast_route(question)
+        if fast is not None:
+            return fast
+
         system = self.prompts.get("classifier_system")
         user_tmpl = self.prompts.get("classifier_user_template")
         if not system or not user_tmpl:
             # If prompts are missing, safest default is out_of_scope (app still works)
             return "out_of_scope"
 
-        user = user_tmpl.format(question=question)
+        user = self._user_renderers["classifier_user_template"](question=question)
+
+        cache_key = self._response_cache_key("classifier", system, user)
+        if cache_key is not None and cache_key in self._response_cache:
+            route = self._response_cache[cache_key]
+            if self.capture_debug:
+                self.debug_info["classifier_route"] = route
+            return route
 
         txt = self._generate_text(
             provider=provider,
             system=system,
             user=user,
-            bedrock_model_id=bedrock_model_id,
+            bedrock_model_id=self.classifier_model_id,
             aws_region=aws_region,
-            max_tokens=self.max_tokens,
+            max_tokens=self.classifier_max_tokens,
             temperature=self.temperature,
         )
+        route = self._finish_route(txt)
+        if cache_key is not None:
+            self._response_cache[cache_key] = route
+        return route
+
+    async def aroute_question(
+        self,
+        *,
+        provider: str,
+        question: str,
+        bedrock_model_id: str,
+        aws_region: str,
+    ) -> str:
+        """
+        Async variant of route_question; awaitable so callers can overlap it with
+        other LLM stages via asyncio.gather.
+        """
+        fast = self._fast_route(question)
+        if fast is not None:
+            return fast
+
+        system = self.prompts.get("classifier_system")
+        user_tmpl = self.prompts.get("classifier_user_template")
+        if not system or not user_tmpl:
+            return "out_of_scope"
+
+        user = self._user_renderers["classifier_user_template"](question=question)
+
+        cache_key = self._response_cache_key("classifier", system, user)
+        if cache_key is not None and cache_key in self._response_cache:
+            route = self._response_cache[cache_key]
+            if self.capture_debug:
+                self.debug_info["classifier_route"] = route
+            return route
+
+        txt = await self._agenerate_text(
+            provider=provider,
+            system=system,
+            user=user,
+            bedrock_model_id=self.classifier_model_id,
+            aws_region=aws_region,
+            max_tokens=self.classifier_max_tokens,
+            temperature=self.temperature,
+        )
+        route = self._finish_route(txt)
+        if cache_key is not None:
+            self._response_cache[cache_key] = route
+        return route
+
+    # Speculate (classifier + planner in parallel) only above this word count:
+    # shorter questions are mostly help/meta/goodbye phrasing, where the
+    # speculative planner call would usually be wasted.
+    _SPECULATIVE_MIN_WORDS = 6
+
+    async def classify_and_plan(
+        self,
+        *,
+        provider: str,
+        question: str,
+        history: str,
+        last_plan_json: str,
+        bedrock_model_id: str,
+        aws_region: str,
+    ) -> tuple[str, Optional[QueryPlan]]:
+        """
+        Runs the classifier and, speculatively, the planner in parallel.
+
+        Dataset questions dominate traffic, and classifying first serializes two
+        Bedrock round-trips. Issuing both with asyncio.gather hides the planner
+        RTT behind the classifier RTT; when the route turns out to be non-dataset
+        the planner output is simply dropped. Returns (route, plan) where plan is
+        None whenever speculation was skipped or discarded — callers then fall
+        back to build_plan as before.
+        """
+        if len(question.split()) <= self._SPECULATIVE_MIN_WORDS:
+            route = await self.aroute_question(
+                provider=provider,
+                question=question,
+                bedrock_model_id=bedrock_model_id,
+                aws_region=aws_region,
+            )
+            return route, None
+
+        route_res, plan_res = await asyncio.gather(
+            self.aroute_question(
+                provider=provider,
+                question=question,
+                bedrock_model_id=bedrock_model_id,
+                aws_region=aws_region,
+            ),
+            self.abuild_plan(
+                provider=provider,
+                question=question,
+                history=history,
+                last_plan_json=last_plan_json,
+                bedrock_model_id=bedrock_model_id,
+                aws_region=aws_region,
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(route_res, BaseException):
+            raise route_res
+        if route_res != "dataset" or isinstance(plan_res, BaseException):
+            return route_res, None
+        return route_res, plan_res
 
-        self.debug_info["classifier_raw"] = txt
+    # Bound on concurrent Bedrock calls in aroute_questions: keeps a batch well
+    # inside the per-region request-rate quota.
+    _BATCH_CONCURRENCY = 16
 
+    async def aroute_questions(
+        self,
+        questions: list[str],
+        *,
+        provider: str,
+        bedrock_model_id: str,
+        aws_region: str,
+    ) -> list[str]:
+        """
+        Classifies a batch of questions concurrently (bounded by a semaphore so
+        a large batch doesn't trip Bedrock rate limits). The result list is
+        aligned to the input order, and a failing item falls back to
+        "out_of_scope" instead of aborting the whole batch.
+        """
+        sem = asyncio.Semaphore(self._BATCH_CONCURRENCY)
+
+        async def _route_one(question: str) -> str:
+            async with sem:
+                try:
+                    return await self.aroute_question(
+                        provider=provider,
+                        question=question,
+                        bedrock_model_id=bedrock_model_id,
+                        aws_region=aws_region,
+                    )
+                except Exception:
+                    logger.exception("Batch routing failed for question %r", question)
+                    return "out_of_scope"
+
+        return list(await asyncio.gather(*(_route_one(q) for q in questions)))
+
+    def _finish_route(self, txt: str) -> str:
+        """
+        Parses and sanitizes the classifier output (shared by sync/async paths).
+        """
         data = self._safe_parse_json(txt)
         route = str(data.get("route", "out_of_scope")).strip().lower()
         if route not in {"dataset", "meta", "out_of_scope", "terminate"}:
             route = "out_of_scope"  # safest default if LLM doesn't follow instructions
 
-        self.debug_info["classifier_route"] = route
+        if self.capture_debug:
+            self.debug_info["classifier_raw"] = txt
+            self.debug_info["classifier_route"] = route
 
-        logger.info(f"LLM route_question debug: {self.debug_info}")
+        logger.debug("Classifier route=%s", route)
         return route
 
     def answer_meta(
@@ -137,21 +707,118 @@ class LLMRouter:
         if not system or not user_tmpl:
             return "I can help you explore the marketing dataset. Ask something like: 'Total revenue in 2023?'"
 
-        user = user_tmpl.format(history=history, question=question)
+        user = self._user_renderers["meta_user_template"](history=history, question=question)
+
+        cache_key = self._response_cache_key("meta", system, user)
+        if cache_key is not None and cache_key in self._response_cache:
+            return self._response_cache[cache_key]
 
         txt = self._generate_text(
             provider=provider,
             system=system,
             user=user,
-            bedrock_model_id=bedrock_model_id,
+            bedrock_model_id=self.classifier_model_id,
+            aws_region=aws_region,
+            max_tokens=self.meta_max_tokens,
+            temperature=self.temperature,
+        )
+
+        if self.capture_debug:
+            self.debug_info["meta_raw"] = txt
+        logger.debug("Meta answer generated (%d chars)", len(txt))
+        answer = txt.strip()
+        if cache_key is not None:
+            self._response_cache[cache_key] = answer
+        return answer
+
+    async def aanswer_meta(
+        self,
+        *,
+        provider: str,
+        question: str,
+        history: str,
+        bedrock_model_id: str,
+        aws_region: str,
+    ) -> str:
+        """
+        Async variant of answer_meta.
+        """
+        system = self.prompts.get("meta_system")
+        user_tmpl = self.prompts.get("meta_user_template")
+        if not system or not user_tmpl:
+            return "I can help you explore the marketing dataset. Ask something like: 'Total revenue in 2023?'"
+
+        user = self._user_renderers["meta_user_template"](history=history, question=question)
+
+        cache_key = self._response_cache_key("meta", system, user)
+        if cache_key is not None and cache_key in self._response_cache:
+            return self._response_cache[cache_key]
+
+        txt = await self._agenerate_text(
+            provider=provider,
+            system=system,
+            user=user,
+            bedrock_model_id=self.classifier_model_id,
             aws_region=aws_region,
-            max_tokens=self.max_tokens,
+            max_tokens=self.meta_max_tokens,
             temperature=self.temperature,
         )
 
-        self.debug_info["meta_raw"] = txt
-        logger.info(f"LLM route_question debug: {self.debug_info}")
-        return txt.strip()
+        if self.capture_debug:
+            self.debug_info["meta_raw"] = txt
+        logger.debug("Meta answer generated (%d chars)", len(txt))
+        answer = txt.strip()
+        if cache_key is not None:
+            self._response_cache[cache_key] = answer
+        return answer
+
+    def stream_meta_answer(
+        self,
+        *,
+        provider: str,
+        question: str,
+        history: str,
+        bedrock_model_id: str,
+        aws_region: str,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of answer_meta: yields text chunks as Bedrock decodes
+        them, so the CLI can start rendering at first-token latency instead of
+        waiting for the full answer. The assembled answer lands in the same
+        response cache answer_meta uses; a cache hit (or missing prompts) is
+        yielded as a single chunk. The classifier and planner stay
+        non-streaming — their output is parsed as a whole anyway.
+        """
+        system = self.prompts.get("meta_system")
+        user_tmpl = self.prompts.get("meta_user_template")
+        if not system or not user_tmpl:
+            yield "I can help you explore the marketing dataset. Ask something like: 'Total revenue in 2023?'"
+            return
+
+        user = self._user_renderers["meta_user_template"](history=history, question=question)
+
+        cache_key = self._response_cache_key("meta", system, user)
+        if cache_key is not None and cache_key in self._response_cache:
+            yield self._response_cache[cache_key]
+            return
+
+        pieces: list[str] = []
+        for chunk in self._bedrock_claude_messages_stream(
+            model_id=self.classifier_model_id,
+            region=aws_region,
+            system=system,
+            user=user,
+            max_tokens=self.meta_max_tokens,
+            temperature=self.temperature,
+            performance_config=self.performance_config,
+        ):
+            pieces.append(chunk)
+            yield chunk
+
+        answer = "".join(pieces).strip()
+        logger.debug("Meta answer streamed (%d chars)", len(answer))
+        if cache_key is not None and answer and not answer.startswith("LLM call error:"):
+            self._response_cache[cache_key] = answer
 
     def build_plan(
         self,
@@ -176,9 +843,9 @@ class LLMRouter:
         system = self.prompts.get("planner_system")
         user_tmpl = self.prompts.get("planner_user_template")
         if not system or not user_tmpl:
-            return QueryPlan(intent="unknown", metrics=[], groupby=[], time_range={"type": "all", "year": None, "quarter": None}, filters=[], top_n=None, sort_by=None)
+            return self._UNKNOWN_PLAN
 
-        user = user_tmpl.format(question=question, history=history, last_plan_json=last_plan_json)
+        user = self._user_renderers["planner_user_template"](question=question, history=history, last_plan_json=last_plan_json)
 
         txt = self._generate_text(
             provider=provider,
@@ -186,24 +853,62 @@ class LLMRouter:
             user=user,
             bedrock_model_id=bedrock_model_id,
             aws_region=aws_region,
-            max_tokens=self.max_tokens,
+            max_tokens=self.planner_max_tokens,
             temperature=self.temperature,
         )
+        return self._finish_plan(user, txt)
 
-        self.debug_info["planner_prompt"] = user
-        self.debug_info["planner_raw"] = txt
+    async def abuild_plan(
+        self,
+        *,
+        provider: str,
+        question: str,
+        history: str,
+        last_plan_json: str,
+        bedrock_model_id: str,
+        aws_region: str,
+    ) -> QueryPlan:
+        """
+        Async variant of build_plan; awaitable so callers can overlap it with
+        other LLM stages via asyncio.gather.
+        """
+        system = self.prompts.get("planner_system")
+        user_tmpl = self.prompts.get("planner_user_template")
+        if not system or not user_tmpl:
+            return self._UNKNOWN_PLAN
+
+        user = self._user_renderers["planner_user_template"](question=question, history=history, last_plan_json=last_plan_json)
 
+        txt = await self._agenerate_text(
+            provider=provider,
+            system=system,
+            user=user,
+            bedrock_model_id=bedrock_model_id,
+            aws_region=aws_region,
+            max_tokens=self.planner_max_tokens,
+            temperature=self.temperature,
+        )
+        return self._finish_plan(user, txt)
+
+    def _finish_plan(self, user: str, txt: str) -> QueryPlan:
+        """
+        Parses and validates the planner output (shared by sync/async paths).
+        """
         data = self._safe_parse_json(txt)
-        self.debug_info["planner_parsed"] = data
+
+        if self.capture_debug:
+            self.debug_info["planner_prompt"] = user
+            self.debug_info["planner_raw"] = txt
+            self.debug_info["planner_parsed"] = data
 
         try:
-            logger.info(f"LLM route_question debug: {self.debug_info}")
             return QueryPlan.model_validate(data)
         except Exception as e:
             # If LLM output doesn't validate, return unknown so the app can ask a clarification via LLM meta
-            self.debug_info["planner_validate_error"] = str(e)
-            logger.info(f"LLM route_question debug: {self.debug_info}")
-            return QueryPlan(intent="unknown", metrics=[], groupby=[], time_range={"type": "all", "year": None, "quarter": None}, filters=[], top_n=None, sort_by=None)
+            if self.capture_debug:
+                self.debug_info["planner_validate_error"] = str(e)
+            logger.debug("Planner output failed validation: %s", e)
+            return self._UNKNOWN_PLAN
 
 
     def _generate_text(
@@ -230,6 +935,31 @@ class LLMRouter:
             user=user,
             max_tokens=max_tokens,
             temperature=temperature,
+            performance_config=self.performance_config,
+        )
+
+    async def _agenerate_text(
+        self,
+        *,
+        provider: str,
+        system: str,
+        user: str,
+        bedrock_model_id: str,
+        aws_region: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """
+        Async counterpart of _generate_text with the same provider routing.
+        """
+        return await self._abedrock_claude_messages(
+            model_id=bedrock_model_id,
+            region=aws_region,
+            system=system,
+            user=user,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            performance_config=self.performance_config,
         )
 
     @staticmethod
@@ -241,6 +971,7 @@ class LLMRouter:
         user: str,
         max_tokens: int,
         temperature: float,
+        performance_config: bool = False,
     ) -> str:
         """
         Claude 3 / 3.5 on Bedrock via Messages API style payload.
@@ -248,32 +979,191 @@ class LLMRouter:
         - anthropic.claude-3-5-sonnet-20240620-v1:0
         - anthropic.claude-3-sonnet-20240229-v1:0
         - anthropic.claude-3-haiku-20240307-v1:0
+        When performance_config is set and the model supports it, the request is
+        routed to Bedrock's latency-optimized serving variant.
         """
-        client = boto3.client("bedrock-runtime", region_name=region)
+        client = _get_bedrock_client(region)
 
-        payload = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": int(max_tokens),
-            "temperature": float(temperature),
-            "system": system,
-            "messages": [
-                {"role": "user", "content": user}
-            ],
+        payload = _claude_payload(
+            model_id=model_id,
+            system=system,
+            user=user,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        kwargs: Dict[str, Any] = {
+            "modelId": model_id,
+            "body": _json_dumps_bytes(payload),
         }
+        if performance_config and _supports_latency_optimized(model_id):
+            kwargs["performanceConfigLatency"] = "optimized"
         try:
-            resp = client.invoke_model(
-                modelId=model_id,
-                body=json.dumps(payload).encode("utf-8"),
-            )
+            resp = client.invoke_model(**kwargs)
         except Exception as e:
             return f"LLM call error: {str(e)}"
-        
+
         body = resp["body"].read()
-        data = json.loads(body)
+        return LLMRouter._extract_claude_text(_json_loads(body))
+
+    @staticmethod
+    def _bedrock_claude_messages_stream(
+        *,
+        model_id: str,
+        region: str,
+        system: str,
+        user: str,
+        max_tokens: int,
+        temperature: float,
+        performance_config: bool = False,
+    ) -> Iterator[str]:
+        """
+        Streaming Claude-on-Bedrock call via invoke_model_with_response_stream.
+        Yields text deltas as they arrive on the wire instead of materializing
+        the whole response before parsing, which surfaces the first token at
+        network latency rather than full-decode latency. Errors are yielded as
+        the usual "LLM call error: ..." text so callers keep one code path.
+        """
+        client = _get_bedrock_client(region)
+
+        payload = _claude_payload(
+            model_id=model_id,
+            system=system,
+            user=user,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        kwargs: Dict[str, Any] = {
+            "modelId": model_id,
+            "body": _json_dumps_bytes(payload),
+        }
+        if performance_config and _supports_latency_optimized(model_id):
+            kwargs["performanceConfigLatency"] = "optimized"
+        try:
+            resp = client.invoke_model_with_response_stream(**kwargs)
+        except Exception as e:
+            yield f"LLM call error: {str(e)}"
+            return
+
+        # Event stream: each chunk wraps a JSON document; text arrives in
+        # content_block_delta events ({"delta": {"type": "text_delta", ...}}).
+        for event in resp["body"]:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            data = _json_loads(chunk["bytes"])
+            if data.get("type") == "content_block_delta":
+                text = data.get("delta", {}).get("text")
+                if text:
+                    yield text
 
+    @staticmethod
+    async def _abedrock_claude_messages(
+        *,
+        model_id: str,
+        region: str,
+        system: str,
+        user: str,
+        max_tokens: int,
+        temperature: float,
+        performance_config: bool = False,
+    ) -> str:
+        """
+        Async Claude-on-Bedrock call. Prefers the direct SigV4+httpx transport
+        (no boto3 per-call overhead), then the shared aioboto3 session, and
+        finally runs the sync client in a worker thread so awaiting callers
+        still overlap the network round-trips.
+        """
+        if httpx is not None and _get_aws_credentials() is not None:
+            payload = _claude_payload(
+                model_id=model_id,
+                system=system,
+                user=user,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            try:
+                raw = await LLMRouter._ahttp_invoke_model(
+                    model_id=model_id,
+                    region=region,
+                    body=_json_dumps_bytes(payload),
+                    latency_optimized=performance_config and _supports_latency_optimized(model_id),
+                )
+            except Exception as e:
+                return f"LLM call error: {str(e)}"
+            return LLMRouter._extract_claude_text(_json_loads(raw))
+
+        if _AIOBOTO3_SESSION is None:
+            return await asyncio.to_thread(
+                LLMRouter._bedrock_claude_messages,
+                model_id=model_id,
+                region=region,
+                system=system,
+                user=user,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                performance_config=performance_config,
+            )
+
+        payload = _claude_payload(
+            model_id=model_id,
+            system=system,
+            user=user,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        kwargs: Dict[str, Any] = {
+            "modelId": model_id,
+            "body": _json_dumps_bytes(payload),
+        }
+        if performance_config and _supports_latency_optimized(model_id):
+            kwargs["performanceConfigLatency"] = "optimized"
+        async with _AIOBOTO3_SESSION.client("bedrock-runtime", region_name=region) as client:
+            try:
+                resp = await client.invoke_model(**kwargs)
+            except Exception as e:
+                return f"LLM call error: {str(e)}"
+            body = await resp["body"].read()
+        return LLMRouter._extract_claude_text(_json_loads(body))
+
+    @staticmethod
+    async def _ahttp_invoke_model(
+        *,
+        model_id: str,
+        region: str,
+        body: bytes,
+        latency_optimized: bool,
+    ) -> bytes:
+        """
+        InvokeModel over raw HTTPS: signs the request with SigV4 and POSTs it
+        through the shared httpx client. Equivalent on the wire to what boto3
+        sends, minus its per-call dispatcher/serializer overhead. Raises on any
+        transport or non-2xx failure; the caller maps that to the usual
+        "LLM call error" text.
+        """
+        from botocore.auth import SigV4Auth
+        from botocore.awsrequest import AWSRequest
+
+        url = (
+            f"https://bedrock-runtime.{region}.amazonaws.com"
+            f"/model/{quote(model_id, safe='')}/invoke"
+        )
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if latency_optimized:
+            # REST-API spelling of boto3's performanceConfigLatency kwarg.
+            headers["X-Amzn-Bedrock-PerformanceConfig-Latency"] = "optimized"
+
+        request = AWSRequest(method="POST", url=url, data=body, headers=headers)
+        SigV4Auth(_get_aws_credentials(), "bedrock", region).add_auth(request)
+
+        resp = await _get_httpx_client().post(url, content=body, headers=dict(request.headers))
+        resp.raise_for_status()
+        return resp.content
+
+    @staticmethod
+    def _extract_claude_text(data: dict) -> str:
         # Claude response: {"content":[{"type":"text","text":"..."}], ...}
         content = data.get("content", [])
-        # We want to extract the "text" field from the first item in the "content" list, if it exists and is in the expected format. 
+        # We want to extract the "text" field from the first item in the "content" list, if it exists and is in the expected format.
         # If not, we fallback to returning the whole response as a string for debugging purposes.
         if isinstance(content, list) and content:
             first = content[0]
@@ -300,26 +1190,37 @@ class LLMRouter:
 
         # Remove leading/trailing whitespace
         text = text.strip()
+        if not text:
+            return {}
+
+        # Fast path: with temperature=0 and explicit JSON prompts the model
+        # almost always returns a bare JSON object. Branching on the brace
+        # delimiters keeps the happy path free of any regex work and skips a
+        # doomed parse attempt for clearly non-JSON replies.
+        if text[0] == "{" and text[-1] == "}":
+            try:
+                return _json_loads(text)
+            except Exception:
+                pass
 
         # Remove markdown code fences like ```json ... ``` or ``` ... ``` - Typical of Claude 4 responses, but can appear in other models too.
-        text = re.sub(r"^```json\s*", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"^```\s*", "", text)
-        text = re.sub(r"\s*```$", "", text)
+        text = _FENCE_JSON.sub("", text)
+        text = _FENCE_OPEN.sub("", text)
+        text = _FENCE_CLOSE.sub("", text)
 
-        # Best case: pure JSON
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except Exception:
             pass
 
         # Try to extract the first {...} block
-        m = re.search(r"\{.*\}", text, flags=re.DOTALL)
+        m = _JSON_OBJ.search(text)
         if not m:
             return {}
 
         candidate = m.group(0)
 
         try:
-            return json.loads(candidate)
+            return _json_loads(candidate)
         except Exception:
             return {}
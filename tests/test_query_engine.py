@@ -12,6 +12,8 @@ This is not an exhaustive test suite, but it covers some key scenarios and serve
 from __future__ import annotations
 
 import os
+import shutil
+
 import pytest
 
 from src.data.loader import MarketingDataLoader
@@ -29,15 +31,27 @@ def dataset_path() -> str:
 
 
 @pytest.fixture(scope="session")
-def df(dataset_path):
+def df(dataset_path, tmp_path_factory):
     # Load the dataset once for all tests to speed up execution. The loader will validate and normalize it.
+    # Loading from a copy in a temp dir keeps the loader's Parquet cache out of
+    # the repo root and makes every session exercise the CSV pipeline instead
+    # of silently hitting a cache file left by a previous run.
+    csv_path = tmp_path_factory.mktemp("data") / "marketing_data.csv"
+    shutil.copy(dataset_path, csv_path)
     loader = MarketingDataLoader()
-    return loader.load(dataset_path).df
+    return loader.load(str(csv_path)).df
+
+
+@pytest.fixture(scope="session")
+def engine(df) -> QueryEngine:
+    # One engine for the whole session: QueryEngine precomputes dimension
+    # indexes and time offsets in __init__, and execution never mutates them,
+    # so rebuilding it per test is wasted work.
+    return QueryEngine(df)
 
 
-def test_total_revenue_in_2022(df):
+def test_total_revenue_in_2022(engine):
     # Simple aggregate test: total revenue in 2022 should be non-negative and return a single row with the "revenue" column.
-    engine = QueryEngine(df)
     plan = QueryPlan(
         intent="aggregate",
         metrics=["revenue"],
@@ -51,10 +65,9 @@ def test_total_revenue_in_2022(df):
     assert float(out.iloc[0]["revenue"]) >= 0.0
 
 
-def test_top_5_campaigns_by_revenue_last_quarter(df):
+def test_top_5_campaigns_by_revenue_last_quarter(engine):
     # Test top_n intent: top 5 campaigns by revenue in the last quarter. 
     # Checks that we get at most 5 rows, with the expected columns, and that revenue is sorted descending.
-    engine = QueryEngine(df)
     plan = QueryPlan(
         intent="top_n",
         metrics=["revenue"],
@@ -74,10 +87,9 @@ def test_top_5_campaigns_by_revenue_last_quarter(df):
     assert revenues == sorted(revenues, reverse=True)
 
 
-def test_revenue_and_cost_trend_by_month(df):
+def test_revenue_and_cost_trend_by_month(engine):
     # Test trend intent: revenue and cost trend by month for all time.
     # Checks that we get the expected columns, that the result is non-empty, and that the ordering by year/month is correct (non-decreasing).
-    engine = QueryEngine(df)
     plan = QueryPlan(
         intent="trend",
         metrics=["revenue", "cost"],
@@ -95,10 +107,72 @@ def test_revenue_and_cost_trend_by_month(df):
     assert years_months == sorted(years_months)
 
 
-def test_media_category_highest_profit_q2_2023(df):
+def test_grouped_aggregate_only_returns_observed_category_combos(df, engine):
+    # With categorical dimensions, groupby must not materialize the cartesian product
+    # of all category levels: a filtered aggregate over two categorical keys should
+    # return exactly the combinations that actually occur in the subset.
+    plan = QueryPlan(
+        intent="aggregate",
+        metrics=["revenue"],
+        groupby=["media_category", "product"],
+        time_range=TimeRange(type="year", year=2022),
+    )
+    out = engine.execute(plan)
+
+    subset = df[df["year"] == 2022]
+    expected = len(subset.drop_duplicates(["media_category", "product"]))
+    assert len(out) == expected
+
+
+def test_polars_engine_matches_pandas_engine(df, engine):
+    # The optional Polars backend must produce the same numbers as the pandas engine
+    # for a representative grouped aggregate.
+    pytest.importorskip("polars")
+    from src.engine.polars_engine import PolarsQueryEngine
+
+    plan = QueryPlan(
+        intent="aggregate",
+        metrics=["revenue", "profit"],
+        groupby=["media_category"],
+        time_range=TimeRange(type="year", year=2022),
+    )
+    out_pd = engine.execute(plan)
+    out_pl = PolarsQueryEngine(df).execute(plan)
+
+    assert list(out_pl.columns) == list(out_pd.columns)
+    # Compare per group: the engines may order categorical keys differently.
+    for metric in ("revenue", "profit"):
+        by_pd = dict(zip(out_pd["media_category"].astype(str), out_pd[metric].round(6)))
+        by_pl = dict(zip(out_pl["media_category"].astype(str), out_pl[metric].round(6)))
+        assert by_pl == by_pd
+
+
+def test_duckdb_engine_matches_pandas_engine(df, engine):
+    # The optional DuckDB backend must produce the same numbers as the pandas engine
+    # for a representative grouped aggregate.
+    pytest.importorskip("duckdb")
+    from src.engine.duckdb_engine import DuckDBQueryEngine
+
+    plan = QueryPlan(
+        intent="aggregate",
+        metrics=["revenue", "profit"],
+        groupby=["media_category"],
+        time_range=TimeRange(type="year", year=2022),
+    )
+    out_pd = engine.execute(plan)
+    out_db = DuckDBQueryEngine(df).execute(plan)
+
+    assert list(out_db.columns) == list(out_pd.columns)
+    # Compare per group: the engines may order categorical keys differently.
+    for metric in ("revenue", "profit"):
+        by_pd = dict(zip(out_pd["media_category"].astype(str), out_pd[metric].round(6)))
+        by_db = dict(zip(out_db["media_category"].astype(str), out_db[metric].round(6)))
+        assert by_db == by_pd
+
+
+def test_media_category_highest_profit_q2_2023(engine):
     # Test top_n intent: media category with highest profit in Q2 2023.
     # Checks that we get at most 5 rows, with the expected columns, and that profit is sorted descending.
-    engine = QueryEngine(df)
     plan = QueryPlan(
         intent="top_n",
         metrics=["profit"],